@@ -49,6 +49,7 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'accounts.middleware.LoginRequiredMiddleware',  # Custom middleware
     'accounts.middleware.SessionSecurityMiddleware',  # Custom middleware
+    'accounts.middleware.RoleMiddleware',  # Custom middleware
 ]
 
 ROOT_URLCONF = 'CRM_WEBSITE.urls'
@@ -233,6 +234,13 @@ LOGGING = {
             'level': 'INFO',
             'propagate': False,
         },
+        # writer.apps.WriterConfig.ready() swaps this handler for a
+        # QueueHandler so request threads never block on the file write.
+        'writer': {
+            'handlers': ['file'],
+            'level': 'INFO',
+            'propagate': False,
+        },
     },
 }
 
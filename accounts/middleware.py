@@ -151,6 +151,23 @@ class SessionSecurityMiddleware:
         return ip
 
 
+class RoleMiddleware:
+    """
+    Middleware that resolves the user's role once per request.
+
+    Role-gated decorators (e.g. writer_required) read request.role
+    instead of walking request.user again in every view.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        user = request.user
+        request.role = getattr(user, 'role', None) if user.is_authenticated else None
+        return self.get_response(request)
+
+
 class CSPMiddleware:
     """
     Content Security Policy Middleware
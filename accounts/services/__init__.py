@@ -1,3 +1,3 @@
-from .activity_logger import log_activity_event
+from .activity_logger import log_activity_event, log_activity_events, queue_activity_event
 
-__all__ = ['log_activity_event']
+__all__ = ['log_activity_event', 'log_activity_events', 'queue_activity_event']
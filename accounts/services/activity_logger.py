@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Optional
 
+from django.db import transaction
 from django.utils import timezone
 
 from accounts.models import ActivityLog, CustomUser
 
+logger = logging.getLogger('accounts')
+
+_LOG_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='activity-log')
+
 EVENT_CATEGORY_MAP = {
     'user.registered_at': ActivityLog.CATEGORY_USER,
     'user.email_verified_at': ActivityLog.CATEGORY_USER,
@@ -70,3 +77,74 @@ def log_activity_event(
             'logged_at': timezone.now().isoformat(),
         },
     )
+
+
+def log_activity_events(events) -> list:
+    """
+    Persist several lifecycle events with one bulk INSERT.
+
+    ``events`` is an iterable of dicts taking the same keys as
+    :func:`log_activity_event` (``event_key`` required, the rest optional).
+    Use this when a view emits multiple events in one transaction so they
+    cost a single round-trip instead of one insert each.
+    """
+
+    logged_at = timezone.now().isoformat()
+    instances = []
+    for event in events:
+        event_key = event['event_key']
+        payload = (event.get('metadata') or {}).copy()
+        resolved_category = (
+            event.get('category')
+            or EVENT_CATEGORY_MAP.get(event_key, ActivityLog.CATEGORY_GENERAL)
+        )
+        instances.append(ActivityLog(
+            event_key=event_key,
+            category=resolved_category,
+            subject_user=event.get('subject_user'),
+            performed_by=event.get('performed_by'),
+            metadata={
+                **payload,
+                'logged_at': logged_at,
+            },
+        ))
+
+    return ActivityLog.objects.bulk_create(instances)
+
+
+def queue_activity_event(
+    event_key: str,
+    *,
+    subject_user: Optional[CustomUser] = None,
+    performed_by: Optional[CustomUser] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    category: Optional[str] = None,
+) -> None:
+    """
+    Schedule :func:`log_activity_event` to run on a background thread after
+    the surrounding transaction commits.
+
+    Keeps the audit INSERT off the request's critical path. Events queued
+    this way are best-effort: if the process dies before the worker drains,
+    they are lost, which is acceptable for the audit trail.
+    """
+
+    def _submit():
+        _LOG_EXECUTOR.submit(
+            _log_event_safely,
+            event_key,
+            subject_user=subject_user,
+            performed_by=performed_by,
+            metadata=metadata,
+            category=category,
+        )
+
+    transaction.on_commit(_submit)
+
+
+def _log_event_safely(event_key: str, **kwargs: Any) -> None:
+    """Persist an event, logging (not raising) on failure off-thread."""
+    try:
+        log_activity_event(event_key, **kwargs)
+    except Exception:
+        logger.exception("Failed to persist activity event %s", event_key)
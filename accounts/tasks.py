@@ -0,0 +1,65 @@
+# accounts/tasks.py
+"""Background tasks that keep slow I/O off the request cycle.
+
+The project has no Celery/RQ broker, so tasks run on a small thread pool
+(the same approach :mod:`accounts.services.activity_logger` uses for
+audit writes). Callers pass only plain serializable values, never model
+instances, so the pattern stays drop-in compatible with a real task
+queue later.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.mail import send_mail
+
+logger = logging.getLogger('accounts')
+
+_MAIL_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='accounts-mail')
+
+_PASSWORD_CHANGED_SUBJECT = 'Password Changed - CRM System'
+
+_PASSWORD_CHANGED_BODY = '''
+Dear {full_name},
+
+Your password has been reset by the system administrator.
+
+If you did not request this change, please contact the administrator immediately.
+
+Changed by: {admin_name}
+Time: {timestamp}
+
+Best regards,
+CRM System Team
+'''
+
+
+def send_password_changed_email(user_email, full_name, admin_name, timestamp):
+    """Send the password-change notification; safe to call off-thread."""
+    try:
+        send_mail(
+            subject=_PASSWORD_CHANGED_SUBJECT,
+            message=_PASSWORD_CHANGED_BODY.format(
+                full_name=full_name,
+                admin_name=admin_name,
+                timestamp=timestamp,
+            ),
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            recipient_list=[user_email],
+            fail_silently=True,
+        )
+        logger.info("Password change notification email sent to %s", user_email)
+    except Exception as email_error:
+        logger.warning("Failed to send password change email: %s", email_error)
+
+
+def queue_password_changed_email(user_email, full_name, admin_name, timestamp):
+    """Schedule the notification email on the mail worker pool.
+
+    The SMTP handshake can take hundreds of milliseconds; running it on
+    the pool lets the password-change response return immediately.
+    """
+    _MAIL_EXECUTOR.submit(
+        send_password_changed_email, user_email, full_name, admin_name, timestamp,
+    )
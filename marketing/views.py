@@ -1145,23 +1145,23 @@ def final_job_form(request, system_id):
     # Get form options
     templates = [
         template for template in TemplateMaster.objects.filter(status='active')
-        if not getattr(template, 'is_deleted', False)
+        if not template.is_deleted
     ]
     project_groups = [
         group for group in ProjectGroupMaster.objects.all()
-        if not getattr(group, 'is_deleted', False)
+        if not group.is_deleted
     ]
     referencing_styles = [
         ref for ref in ReferencingMaster.objects.all()
-        if not getattr(ref, 'is_deleted', False)
+        if not ref.is_deleted
     ]
     writing_styles = [
         writing for writing in AcademicWritingMaster.objects.all()
-        if not getattr(writing, 'is_deleted', False)
+        if not writing.is_deleted
     ]
     price_entries = [
         entry for entry in PriceMaster.objects.all()
-        if not getattr(entry, 'is_deleted', False)
+        if not entry.is_deleted
     ]
     price_map = {}
     for entry in price_entries:
@@ -1298,12 +1298,12 @@ def _process_final_form_submission(request, job):
         
         # Get related objects with manual soft-delete checks (djongo friendly)
         template = get_object_or_404(TemplateMaster, id=template_id)
-        if getattr(template, 'is_deleted', False):
+        if template.is_deleted:
             messages.error(request, 'Selected template is no longer available.')
             return redirect('final_job_form', system_id=job.system_id)
 
         project_group = get_object_or_404(ProjectGroupMaster, id=project_group_id)
-        if getattr(project_group, 'is_deleted', False):
+        if project_group.is_deleted:
             messages.error(request, 'Selected project group is no longer available.')
             return redirect('final_job_form', system_id=job.system_id)
         
@@ -1317,7 +1317,7 @@ def _process_final_form_submission(request, job):
                     category=normalized_category,
                     level=price_level
                 )
-                if not getattr(item, 'is_deleted', False)
+                if not item.is_deleted
             ),
             None
         )
@@ -1484,7 +1484,7 @@ def get_system_expected_amount(request):
                 category=normalized_category,
                 level=price_level
             )
-            if not getattr(item, 'is_deleted', False)
+            if not item.is_deleted
         ),
         None
     )
@@ -1965,23 +1965,23 @@ def create_manual_job(request):
     # Get form options
     templates = [
         template for template in TemplateMaster.objects.filter(status='active')
-        if not getattr(template, 'is_deleted', False)
+        if not template.is_deleted
     ]
     project_groups = [
         group for group in ProjectGroupMaster.objects.all()
-        if not getattr(group, 'is_deleted', False)
+        if not group.is_deleted
     ]
     referencing_styles = [
         ref for ref in ReferencingMaster.objects.all()
-        if not getattr(ref, 'is_deleted', False)
+        if not ref.is_deleted
     ]
     writing_styles = [
         writing for writing in AcademicWritingMaster.objects.all()
-        if not getattr(writing, 'is_deleted', False)
+        if not writing.is_deleted
     ]
     price_entries = [
         entry for entry in PriceMaster.objects.all()
-        if not getattr(entry, 'is_deleted', False)
+        if not entry.is_deleted
     ]
     
     # Build price map
@@ -2139,14 +2139,14 @@ def submit_manual_job(request):
         
         # Get related objects
         template = get_object_or_404(TemplateMaster, id=template_id)
-        if getattr(template, 'is_deleted', False):
+        if template.is_deleted:
             return JsonResponse({
                 'success': False,
                 'errors': ['Selected template is no longer available.']
             }, status=400)
 
         project_group = get_object_or_404(ProjectGroupMaster, id=project_group_id)
-        if getattr(project_group, 'is_deleted', False):
+        if project_group.is_deleted:
             return JsonResponse({
                 'success': False,
                 'errors': ['Selected project group is no longer available.']
@@ -2161,7 +2161,7 @@ def submit_manual_job(request):
                     category=normalized_category,
                     level=price_level
                 )
-                if not getattr(item, 'is_deleted', False)
+                if not item.is_deleted
             ),
             None
         )
@@ -0,0 +1,42 @@
+# Generated by Django 3.1.12 on 2026-08-30 08:44
+
+from django.db import migrations
+
+
+def create_price_partial_unique_index(apps, schema_editor):
+    # djongo has no DDL translation for a conditional UniqueConstraint,
+    # so the partial unique index is created directly through pymongo.
+    if schema_editor.connection.vendor != 'djongo':
+        return
+    db = schema_editor.connection.cursor().db_conn
+    db['price_master'].create_index(
+        [('category', 1), ('level', 1)],
+        name='uq_price_active_category_level',
+        unique=True,
+        partialFilterExpression={'is_deleted': False},
+    )
+
+
+def drop_price_partial_unique_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'djongo':
+        return
+    db = schema_editor.connection.cursor().db_conn
+    db['price_master'].drop_index('uq_price_active_category_level')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('superadminpanel', '0007_auto_20251122_1504'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='pricemaster',
+            unique_together=set(),
+        ),
+        migrations.RunPython(
+            create_price_partial_unique_index,
+            drop_price_partial_unique_index,
+        ),
+    ]
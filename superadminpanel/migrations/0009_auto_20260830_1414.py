@@ -0,0 +1,17 @@
+# Generated by Django 3.1.12 on 2026-08-30 08:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('superadminpanel', '0008_auto_20260830_1414'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='referencingmaster',
+            index=models.Index(fields=['is_deleted', '-created_at'], name='ref_active_created_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 3.1.12 on 2026-08-30 08:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('superadminpanel', '0009_auto_20260830_1414'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReferencingMasterStats',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('active_count', models.IntegerField(default=0)),
+                ('last_updated', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Referencing Master Stats',
+                'verbose_name_plural': 'Referencing Master Stats',
+                'db_table': 'referencing_master_stats',
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 3.1.12 on 2026-08-30 08:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('superadminpanel', '0010_referencingmasterstats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='academicwritingmaster',
+            index=models.Index(fields=['is_deleted', '-created_at'], name='writing_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='academicwritingmaster',
+            index=models.Index(fields=['writing_style', 'is_deleted'], name='writing_style_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectgroupmaster',
+            index=models.Index(fields=['is_deleted', '-created_at'], name='group_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='templatemaster',
+            index=models.Index(fields=['is_deleted', '-created_at'], name='template_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='templatemaster',
+            index=models.Index(fields=['template_name', 'is_deleted'], name='template_name_active_idx'),
+        ),
+    ]
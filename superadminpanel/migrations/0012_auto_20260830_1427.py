@@ -0,0 +1,46 @@
+# Generated by Django 3.1.12 on 2026-08-30 08:57
+
+from django.db import migrations
+
+
+def create_partial_unique_indexes(apps, schema_editor):
+    # As in migration 0008: djongo cannot translate a conditional
+    # UniqueConstraint, so the partial unique indexes go straight to
+    # Mongo via pymongo.
+    if schema_editor.connection.vendor != 'djongo':
+        return
+    db = schema_editor.connection.cursor().db_conn
+    db['academic_writing_master'].create_index(
+        [('writing_style', 1)],
+        name='uq_writing_active_style',
+        unique=True,
+        partialFilterExpression={'is_deleted': False},
+    )
+    db['template_master'].create_index(
+        [('template_name', 1)],
+        name='uq_template_active_name',
+        unique=True,
+        partialFilterExpression={'is_deleted': False},
+    )
+
+
+def drop_partial_unique_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'djongo':
+        return
+    db = schema_editor.connection.cursor().db_conn
+    db['academic_writing_master'].drop_index('uq_writing_active_style')
+    db['template_master'].drop_index('uq_template_active_name')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('superadminpanel', '0011_auto_20260830_1422'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_partial_unique_indexes,
+            drop_partial_unique_indexes,
+        ),
+    ]
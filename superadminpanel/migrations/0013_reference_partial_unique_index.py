@@ -0,0 +1,38 @@
+from django.db import migrations
+
+
+def create_reference_partial_unique_index(apps, schema_editor):
+    # As in migrations 0008/0012: djongo cannot translate a conditional
+    # UniqueConstraint, so the partial unique index is created directly
+    # through pymongo. It closes the race the Python-side duplicate
+    # check in create_reference cannot.
+    if schema_editor.connection.vendor != 'djongo':
+        return
+    db = schema_editor.connection.cursor().db_conn
+    db['referencing_master'].create_index(
+        [('referencing_style', 1), ('used_in', 1)],
+        name='uq_reference_active_style_used_in',
+        unique=True,
+        partialFilterExpression={'is_deleted': False},
+    )
+
+
+def drop_reference_partial_unique_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'djongo':
+        return
+    db = schema_editor.connection.cursor().db_conn
+    db['referencing_master'].drop_index('uq_reference_active_style_used_in')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('superadminpanel', '0012_auto_20260830_1427'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_reference_partial_unique_index,
+            drop_reference_partial_unique_index,
+        ),
+    ]
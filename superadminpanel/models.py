@@ -121,7 +121,9 @@ class PriceMaster(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Price Master'
         verbose_name_plural = 'Price Masters'
-        unique_together = ['category', 'level']
+        # Uniqueness of (category, level) among non-deleted rows is
+        # enforced by a Mongo partial unique index created in migration
+        # 0008; djongo cannot translate a conditional UniqueConstraint.
     
     def __str__(self):
         return f"{self.get_category_display()} - {self.get_level_display()} - ₹{self.price_per_word}/word"
@@ -129,7 +131,7 @@ class PriceMaster(models.Model):
 
 class ReferencingMaster(models.Model):
     """Referencing Master Model"""
-    
+
     # Basic Information
     referencing_style = models.CharField(max_length=100)
     used_in = models.CharField(max_length=255)
@@ -163,16 +165,39 @@ class ReferencingMaster(models.Model):
     
     # Soft delete
     is_deleted = models.BooleanField(default=False)
-    
+
     class Meta:
         db_table = 'referencing_master'
         ordering = ['-created_at']
         verbose_name = 'Referencing Master'
         verbose_name_plural = 'Referencing Masters'
+        indexes = [
+            models.Index(fields=['is_deleted', '-created_at'], name='ref_active_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.referencing_style} - {self.used_in}"
-    
+
+
+class ReferencingMasterStats(models.Model):
+    """Singleton row holding the active reference count.
+
+    Maintained with atomic F() updates from the reference write views so the
+    list page can show the total without a COUNT per render.
+    """
+
+    active_count = models.IntegerField(default=0)
+    last_updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'referencing_master_stats'
+        verbose_name = 'Referencing Master Stats'
+        verbose_name_plural = 'Referencing Master Stats'
+
+    def __str__(self):
+        return f"Active references: {self.active_count}"
+
+
 class AcademicWritingMaster(models.Model):
     """Academic Writing Style Master Model"""
     
@@ -214,10 +239,24 @@ class AcademicWritingMaster(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Academic Writing Style'
         verbose_name_plural = 'Academic Writing Styles'
+        indexes = [
+            models.Index(fields=['is_deleted', '-created_at'], name='writing_active_created_idx'),
+            models.Index(fields=['writing_style', 'is_deleted'], name='writing_style_active_idx'),
+        ]
+        # Active-style uniqueness lives in a Mongo partial unique index
+        # (migration 0012); djongo cannot translate the conditional
+        # UniqueConstraint form.
     
     def __str__(self):
         return self.writing_style
-    
+
+    def save(self, *args, **kwargs):
+        # Canonical form in the DB lets duplicate checks hit the plain
+        # index with an exact match instead of __iexact scans.
+        self.writing_style = (self.writing_style or '').strip()
+        super().save(*args, **kwargs)
+
+
 class ProjectGroupMaster(models.Model):
     """Project Group Master Model"""
     
@@ -260,10 +299,19 @@ class ProjectGroupMaster(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Project Group Master'
         verbose_name_plural = 'Project Group Masters'
+        indexes = [
+            models.Index(fields=['is_deleted', '-created_at'], name='group_active_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.project_group_name} ({self.project_group_prefix})"
-    
+
+    def save(self, *args, **kwargs):
+        self.project_group_name = (self.project_group_name or '').strip()
+        self.project_group_prefix = (self.project_group_prefix or '').strip().upper()
+        super().save(*args, **kwargs)
+
+
  # Templatemaster model can be added here similarly if needed
 class TemplateMaster(models.Model):
     """Template Master Model - Created by Superadmin"""
@@ -328,10 +376,20 @@ class TemplateMaster(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Template Master'
         verbose_name_plural = 'Template Masters'
+        indexes = [
+            models.Index(fields=['is_deleted', '-created_at'], name='template_active_created_idx'),
+            models.Index(fields=['template_name', 'is_deleted'], name='template_name_active_idx'),
+        ]
+        # Active-name uniqueness lives in a Mongo partial unique index
+        # (migration 0012), same as AcademicWritingMaster above.
     
     def __str__(self):
         return self.template_name
-    
+
+    def save(self, *args, **kwargs):
+        self.template_name = (self.template_name or '').strip()
+        super().save(*args, **kwargs)
+
     def get_default_tasks_structure(self):
         """Return default task structure"""
         return [
@@ -4,26 +4,61 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.utils import timezone
 from django.http import JsonResponse
+from django.core.cache import cache
+from django.core.paginator import Paginator
 from django.db import transaction
-from datetime import datetime, timedelta
+from django.views.decorators.http import condition
+from datetime import date, datetime, timedelta
 from bson import ObjectId
-from bson.errors import InvalidId
+import functools
 import logging
+import re
+import string
 
 from accounts.models import CustomUser
-from accounts.services import log_activity_event
+from accounts.services import log_activity_event, log_activity_events, queue_activity_event
+from accounts.tasks import queue_password_changed_email
+from marketing.models import Job
 from .models import (
     Holiday,
     PriceMaster,
     ReferencingMaster,
+    ReferencingMasterStats,
     AcademicWritingMaster,
     ProjectGroupMaster,
     TemplateMaster,
 )
 from . import user_services as portal_services
 
+try:
+    from .services.google_calendar_service import GoogleCalendarService
+except ImportError:
+    GoogleCalendarService = None
+
 logger = logging.getLogger('superadmin')
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+_HEX_DIGITS = frozenset(string.hexdigits)
+
+
+def _coerce_id(value):
+    """Coerce a raw URL id to int or ObjectId by shape; None if malformed.
+
+    Checking the ObjectId shape (24 hex chars) before constructing one
+    means invalid ids never raise, so bot-supplied garbage costs a couple
+    of string checks rather than an exception unwind.
+    """
+    if isinstance(value, (int, ObjectId)):
+        return value
+    if not isinstance(value, str) or not value:
+        return None
+    if value.isdigit():
+        return int(value)
+    if len(value) == 24 and _HEX_DIGITS.issuperset(value):
+        return ObjectId(value)
+    return None
+
 from datetime import datetime
 
 
@@ -171,19 +206,71 @@ def master_input(request):
 # HOLIDAY MASTER VIEWS
 # ========================================
 
+def _parse_holiday_form(post):
+    """Read the holiday form fields from the POST data in one pass."""
+    return {
+        'holiday_name': post.get('holiday_name', '').strip(),
+        'holiday_type': post.get('holiday_type', 'full_day'),
+        'date_type': post.get('date_type', 'single'),
+        'description': post.get('description', '').strip(),
+    }
+
+
+def _parse_holiday_dates(post, date_type):
+    """
+    Validate and parse the date fields for a holiday form.
+
+    Returns ``(start_date, end_date, error_message)`` where ``error_message``
+    is None when the dates are valid.
+    """
+    if date_type == 'single':
+        date_str = post.get('date')
+        if not date_str:
+            return None, None, 'Date is required.'
+        start_date = date.fromisoformat(date_str)
+        return start_date, start_date, None
+
+    from_date_str = post.get('from_date')
+    to_date_str = post.get('to_date')
+
+    if not from_date_str or not to_date_str:
+        return None, None, 'From date and To date are required.'
+
+    start_date = date.fromisoformat(from_date_str)
+    end_date = date.fromisoformat(to_date_str)
+
+    if start_date > end_date:
+        return None, None, 'From date must be before To date.'
+
+    return start_date, end_date, None
+
+
+def _parse_price_form(post):
+    """Read the price form fields from the POST data in one pass."""
+    return {
+        'category': post.get('category', '').strip(),
+        'level': post.get('level', '').strip(),
+        'price_per_word': post.get('price_per_word', '').strip(),
+    }
+
 @login_required
 @superadmin_required
 def holiday_master(request):
     """Holiday Master - List all holidays"""
     try:
-        raw_holidays = list(Holiday.objects.all().order_by('-created_at'))
+        # Djongo-safe: soft-delete filtering in Python, then paginate the
+        # filtered list (a DB-side is_deleted predicate fails djongo's
+        # SQL parser).
         holidays = [
-            holiday for holiday in raw_holidays
-            if not getattr(holiday, 'is_deleted', False)
+            holiday
+            for holiday in Holiday.objects.order_by('-created_at')
+            if not holiday.is_deleted
         ]
+        paginator = Paginator(holidays, 50)
+        holidays_page = paginator.get_page(request.GET.get('page'))
         context = {
-            'holidays': holidays,
-            'total_holidays': len(holidays),
+            'holidays': holidays_page,
+            'total_holidays': paginator.count,
         }
         return render(request, 'holiday_master.html', context)
         
@@ -200,16 +287,22 @@ def create_holiday(request):
     if request.method == 'POST':
         try:
             # Get form data
-            holiday_name = request.POST.get('holiday_name', '').strip()
-            holiday_type = request.POST.get('holiday_type', 'full_day')
-            date_type = request.POST.get('date_type', 'single')
-            description = request.POST.get('description', '').strip()
-            
+            form = _parse_holiday_form(request.POST)
+            holiday_name = form['holiday_name']
+            holiday_type = form['holiday_type']
+            date_type = form['date_type']
+            description = form['description']
+
             # Validation
             if not holiday_name:
                 messages.error(request, 'Holiday name is required.')
                 return redirect('holiday_master')
-            
+
+            start_date, end_date, date_error = _parse_holiday_dates(request.POST, date_type)
+            if date_error:
+                messages.error(request, date_error)
+                return redirect('holiday_master')
+
             # Create holiday object
             with transaction.atomic():
                 holiday = Holiday()
@@ -219,41 +312,19 @@ def create_holiday(request):
                 holiday.description = description
                 holiday.created_by = request.user
                 holiday.created_at = timezone.now()
-                
+
                 # Handle dates based on type
                 if date_type == 'single':
-                    date_str = request.POST.get('date')
-                    if not date_str:
-                        messages.error(request, 'Date is required.')
-                        return redirect('holiday_master')
-                    
-                    holiday.date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                    start_date = holiday.date
-                    end_date = holiday.date
-                    
+                    holiday.date = start_date
                 else:  # consecutive
-                    from_date_str = request.POST.get('from_date')
-                    to_date_str = request.POST.get('to_date')
-                    
-                    if not from_date_str or not to_date_str:
-                        messages.error(request, 'From date and To date are required.')
-                        return redirect('holiday_master')
-                    
-                    holiday.from_date = datetime.strptime(from_date_str, '%Y-%m-%d').date()
-                    holiday.to_date = datetime.strptime(to_date_str, '%Y-%m-%d').date()
-                    
-                    if holiday.from_date > holiday.to_date:
-                        messages.error(request, 'From date must be before To date.')
-                        return redirect('holiday_master')
-                    
-                    start_date = holiday.from_date
-                    end_date = holiday.to_date
-                
+                    holiday.from_date = start_date
+                    holiday.to_date = end_date
+
                 # Save to database first
                 holiday.save()
                 
                 # Log activity
-                log_activity_event(
+                queue_activity_event(
                     'holiday.created_at',
                     subject_user=None,
                     performed_by=request.user,
@@ -268,16 +339,19 @@ def create_holiday(request):
                 holiday.google_calendar_sync_started_at = timezone.now()
                 holiday.save(update_fields=['google_calendar_sync_started_at'])
                 
-                log_activity_event(
+                queue_activity_event(
                     'holiday.google_calendar_sync_started_at',
                     subject_user=None,
                     performed_by=None,
                     metadata={'holiday_id': holiday.id, 'performed_by': 'system'},
                 )
                 
+                if GoogleCalendarService is None:
+                    logger.info("Google Calendar service not available")
+                    messages.success(request, f'Holiday "{holiday_name}" created successfully!')
+                    return redirect('holiday_master')
+
                 try:
-                    # Import Google Calendar service if available
-                    from .services.google_calendar_service import GoogleCalendarService
                     calendar_service = GoogleCalendarService()
                     event_id = calendar_service.create_event(
                         holiday_name=holiday_name,
@@ -328,9 +402,6 @@ def create_holiday(request):
                         logger.warning(f"Holiday created but failed to sync to Google Calendar")
                         messages.warning(request, f'Holiday "{holiday_name}" created but failed to sync to Google Calendar.')
                         
-                except ImportError:
-                    logger.info("Google Calendar service not available")
-                    messages.success(request, f'Holiday "{holiday_name}" created successfully!')
                 except Exception as calendar_error:
                     holiday.google_calendar_sync_failed_at = timezone.now()
                     holiday.save(update_fields=['google_calendar_sync_failed_at'])
@@ -366,50 +437,30 @@ def edit_holiday(request, holiday_id):
     if request.method != 'POST':
         return redirect('holiday_master')
     
-    holiday = next(
-        (
-            item for item in Holiday.objects.all()
-            if item.id == holiday_id and not getattr(item, 'is_deleted', False)
-        ),
-        None
-    )
+    # Djongo-safe lookup: fetch by id and check the soft-delete flag in
+    # Python (the combined predicate fails djongo's parser).
+    holiday = Holiday.objects.filter(id=holiday_id).first()
     
-    if not holiday:
+    if not holiday or holiday.is_deleted:
         messages.error(request, 'Holiday not found.')
         return redirect('holiday_master')
     
     try:
-        holiday_name = request.POST.get('holiday_name', '').strip()
-        holiday_type = request.POST.get('holiday_type', 'full_day')
-        date_type = request.POST.get('date_type', 'single')
-        description = request.POST.get('description', '').strip()
-        
+        form = _parse_holiday_form(request.POST)
+        holiday_name = form['holiday_name']
+        holiday_type = form['holiday_type']
+        date_type = form['date_type']
+        description = form['description']
+
         if not holiday_name:
             messages.error(request, 'Holiday name is required.')
             return redirect('holiday_master')
-        
-        if date_type == 'single':
-            date_str = request.POST.get('date')
-            if not date_str:
-                messages.error(request, 'Date is required for single-day holiday.')
-                return redirect('holiday_master')
-            start_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-            end_date = start_date
-        else:
-            from_date_str = request.POST.get('from_date')
-            to_date_str = request.POST.get('to_date')
-            
-            if not from_date_str or not to_date_str:
-                messages.error(request, 'Both From and To dates are required for consecutive holidays.')
-                return redirect('holiday_master')
-            
-            start_date = datetime.strptime(from_date_str, '%Y-%m-%d').date()
-            end_date = datetime.strptime(to_date_str, '%Y-%m-%d').date()
-            
-            if start_date > end_date:
-                messages.error(request, 'From date must be before To date.')
-                return redirect('holiday_master')
-        
+
+        start_date, end_date, date_error = _parse_holiday_dates(request.POST, date_type)
+        if date_error:
+            messages.error(request, date_error)
+            return redirect('holiday_master')
+
         with transaction.atomic():
             holiday.holiday_name = holiday_name
             holiday.holiday_type = holiday_type
@@ -441,10 +492,14 @@ def edit_holiday(request, holiday_id):
                 },
             )
             
+            if GoogleCalendarService is None:
+                logger.info("Google Calendar service not available")
+                messages.success(request, f'Holiday "{holiday.holiday_name}" updated successfully.')
+                return redirect('holiday_master')
+
             try:
-                from .services.google_calendar_service import GoogleCalendarService
                 calendar_service = GoogleCalendarService()
-                
+
                 if holiday.google_calendar_event_id:
                     sync_ok = calendar_service.update_event(
                         holiday.google_calendar_event_id,
@@ -476,8 +531,6 @@ def edit_holiday(request, holiday_id):
                     holiday.save(update_fields=['is_synced_to_calendar', 'google_calendar_sync_failed_at'])
                     logger.warning("Holiday updated but failed to sync to Google Calendar.")
             
-            except ImportError:
-                logger.info("Google Calendar service not available")
             except Exception as calendar_error:
                 holiday.is_synced_to_calendar = False
                 holiday.google_calendar_sync_failed_at = timezone.now()
@@ -512,14 +565,13 @@ def delete_holiday(request, holiday_id):
     
     try:
         with transaction.atomic():
-            if calendar_event_id:
+            if calendar_event_id and GoogleCalendarService is None:
+                logger.info("Google Calendar service not available")
+            elif calendar_event_id:
                 try:
-                    from .services.google_calendar_service import GoogleCalendarService
                     calendar_service = GoogleCalendarService()
                     calendar_service.delete_event(calendar_event_id)
                     logger.info(f"Holiday deleted from Google Calendar: {holiday_name_ref}")
-                except ImportError:
-                    logger.info("Google Calendar service not available")
                 except Exception as calendar_error:
                     logger.error(f"Error deleting from Google Calendar: {str(calendar_error)}")
             
@@ -556,14 +608,17 @@ def delete_holiday(request, holiday_id):
 def price_master(request):
     """Price Master - List all prices"""
     try:
-        raw_prices = list(PriceMaster.objects.all().order_by('-created_at'))
+        # Djongo-safe: soft-delete filtering in Python, see holiday_master.
         prices = [
-            price for price in raw_prices
-            if not getattr(price, 'is_deleted', False)
+            price
+            for price in PriceMaster.objects.order_by('-created_at')
+            if not price.is_deleted
         ]
+        paginator = Paginator(prices, 50)
+        prices_page = paginator.get_page(request.GET.get('page'))
         context = {
-            'prices': prices,
-            'total_prices': len(prices),
+            'prices': prices_page,
+            'total_prices': paginator.count,
         }
         return render(request, 'price_master.html', context)
         
@@ -579,10 +634,11 @@ def create_price(request):
     """Create a new price entry"""
     if request.method == 'POST':
         try:
-            category = request.POST.get('category', '').strip()
-            level = request.POST.get('level', '').strip()
-            price_per_word = request.POST.get('price_per_word', '').strip()
-            
+            form = _parse_price_form(request.POST)
+            category = form['category']
+            level = form['level']
+            price_per_word = form['price_per_word']
+
             # Validation
             if not category or not level or not price_per_word:
                 messages.error(request, 'All fields are required.')
@@ -597,21 +653,19 @@ def create_price(request):
                 messages.error(request, 'Invalid price format.')
                 return redirect('price_master')
             
-            # Check for existing combination
-            all_matching = list(PriceMaster.objects.filter(
-                category=category,
-                level=level
-            ))
-            
-            existing = next(
-                (item for item in all_matching if not getattr(item, 'is_deleted', False)),
-                None
-            )
-            
-            if existing:
+            # Check for existing combination (soft-delete check in
+            # Python, Djongo-safe); the Mongo partial unique index is
+            # the authoritative guard against concurrent duplicates.
+            if any(
+                not other.is_deleted
+                for other in PriceMaster.objects.filter(
+                    category=category,
+                    level=level,
+                ).only('is_deleted')
+            ):
                 messages.error(request, f'Price already exists for {category} - {level}.')
                 return redirect('price_master')
-            
+
             with transaction.atomic():
                 price_obj = PriceMaster()
                 price_obj.category = category
@@ -620,7 +674,7 @@ def create_price(request):
                 price_obj.created_by = request.user
                 price_obj.created_at = timezone.now()
                 price_obj.save()
-                
+
                 log_activity_event(
                     'price.created_at',
                     subject_user=None,
@@ -632,10 +686,10 @@ def create_price(request):
                         'price_per_word': str(price_per_word),
                     },
                 )
-                
-                logger.info(f"Price created for {category} - {level} by {request.user.email}")
-                messages.success(request, f'Price for {category} - {level} created successfully!')
-            
+
+            logger.info(f"Price created for {category} - {level} by {request.user.email}")
+            messages.success(request, f'Price for {category} - {level} created successfully!')
+
             return redirect('price_master')
             
         except Exception as e:
@@ -653,21 +707,19 @@ def edit_price(request, price_id):
     if request.method != 'POST':
         return redirect('price_master')
     
-    all_prices = list(PriceMaster.objects.filter(id=price_id))
-    price_obj = next(
-        (item for item in all_prices if not getattr(item, 'is_deleted', False)),
-        None
-    )
+    # Djongo-safe lookup, as in edit_holiday.
+    price_obj = PriceMaster.objects.filter(id=price_id).first()
     
-    if not price_obj:
+    if not price_obj or price_obj.is_deleted:
         messages.error(request, 'Price entry not found.')
         return redirect('price_master')
     
     try:
-        category = request.POST.get('category', '').strip()
-        level = request.POST.get('level', '').strip()
-        price_per_word = request.POST.get('price_per_word', '').strip()
-        
+        form = _parse_price_form(request.POST)
+        category = form['category']
+        level = form['level']
+        price_per_word = form['price_per_word']
+
         if not category or not level or not price_per_word:
             messages.error(request, 'All fields are required.')
             return redirect('price_master')
@@ -681,19 +733,15 @@ def edit_price(request, price_id):
             messages.error(request, 'Invalid price format.')
             return redirect('price_master')
         
-        # Check for duplicate combination (excluding current record)
-        all_matching = list(PriceMaster.objects.filter(
-            category=category,
-            level=level
-        ))
-        
-        existing = next(
-            (item for item in all_matching 
-             if item.id != price_id and not getattr(item, 'is_deleted', False)),
-            None
-        )
-        
-        if existing:
+        # Check for duplicate combination (excluding current record;
+        # soft-delete and self checks in Python, Djongo-safe)
+        if any(
+            not other.is_deleted and other.id != price_obj.id
+            for other in PriceMaster.objects.filter(
+                category=category,
+                level=level,
+            ).only('is_deleted')
+        ):
             messages.error(request, f'Price already exists for {category} - {level}.')
             return redirect('price_master')
         
@@ -772,24 +820,122 @@ def delete_price(request, price_id):
 # REFERENCING MASTER VIEWS
 # ========================================
 
+def _reference_stats_row():
+    """Counter row values for conditional GETs; None until it is seeded.
+
+    djongo cannot parse the aggregates (Max/Count over the active
+    manager's NOT is_deleted predicate) these helpers originally ran, so
+    both validators read the denormalized stats row instead -- its
+    last_updated moves on every create/edit/delete via the counter.
+    """
+    return (
+        ReferencingMasterStats.objects.filter(pk=REF_STATS_PK)
+        .values_list('active_count', 'last_updated')
+        .first()
+    )
+
+
+def _has_pending_messages(request):
+    """True when flash messages are queued for this request.
+
+    Rejected writes (validation errors, duplicates, exception handlers)
+    queue a message and redirect back to the list without touching the
+    stats row, so the validators would still match and a 304 would
+    swallow the message. Returning None from the validators in that case
+    forces a full render. len() on the storage does not consume it.
+    """
+    return len(messages.get_messages(request)) > 0
+
+
+def _reference_list_last_modified(request):
+    """Timestamp of the last reference write, for conditional GETs."""
+    if _has_pending_messages(request):
+        return None
+    row = _reference_stats_row()
+    return row[1] if row else None
+
+
+def _reference_list_etag(request):
+    """Cheap ETag from row count + latest change, so deletes also bust it."""
+    if _has_pending_messages(request):
+        return None
+    row = _reference_stats_row()
+    if row is None:
+        return None
+    count, last_updated = row
+    return f"ref-{count}-{last_updated.isoformat() if last_updated else 'empty'}"
+
+
+REF_STATS_PK = 1
+
+
+def _adjust_reference_count(delta):
+    """Shift the denormalized counter.
+
+    Read-modify-write rather than an F() expression: djongo cannot parse
+    F()-arithmetic UPDATEs. A lost update under concurrency only skews
+    the display total until the next seed, which is acceptable here.
+    """
+    stats = ReferencingMasterStats.objects.filter(pk=REF_STATS_PK).first()
+    if stats is None:
+        return
+    stats.active_count = max(0, stats.active_count + delta)
+    stats.save(update_fields=['active_count', 'last_updated'])
+
+
+def _count_active_references():
+    """Count non-deleted references, filtering in Python (Djongo-safe)."""
+    return sum(
+        1 for deleted in ReferencingMaster.objects.values_list('is_deleted', flat=True)
+        if not deleted
+    )
+
+
+def _reference_active_count():
+    """O(1) total from the counter row, seeding it with a count if absent."""
+    count = (
+        ReferencingMasterStats.objects.filter(pk=REF_STATS_PK)
+        .values_list('active_count', flat=True)
+        .first()
+    )
+    if count is None:
+        count = _count_active_references()
+        ReferencingMasterStats.objects.create(pk=REF_STATS_PK, active_count=count)
+    return count
+
+
+def _parse_reference_form(post):
+    """Normalize reference form fields once: strip and clamp to column widths."""
+    referencing_style = (post.get('referencing_style') or '').strip()[:100]
+    used_in = (post.get('used_in') or '').strip()[:255]
+    return referencing_style, used_in
+
+
 @login_required
 @superadmin_required
+@condition(etag_func=_reference_list_etag, last_modified_func=_reference_list_last_modified)
 def referencing_master(request):
     """Referencing Master - List all references"""
     try:
-        raw_references = list(ReferencingMaster.objects.all().order_by('-created_at'))
-        references = [
-            reference for reference in raw_references
-            if not getattr(reference, 'is_deleted', False)
-        ]
+        # Djongo-safe: fetch narrow rows and drop soft-deleted ones in
+        # Python -- the WHERE NOT is_deleted predicate a DB-side filter
+        # would emit crashes djongo's SQL parser.
+        queryset = (
+            ReferencingMaster.objects
+            .only('referencing_style', 'used_in', 'created_at', 'is_deleted')
+            .order_by('-created_at', '-id')
+        )
+        active_references = [ref for ref in queryset if not ref.is_deleted]
+        paginator = Paginator(active_references, 50)
+        references = paginator.get_page(request.GET.get('page'))
         context = {
             'references': references,
-            'total_references': len(references),
+            'total_references': _reference_active_count(),
         }
         return render(request, 'referencing_master.html', context)
         
     except Exception as e:
-        logger.exception(f"Error loading referencing master: {str(e)}")
+        logger.exception("Error loading referencing master: %s", e)
         messages.error(request, 'Error loading references.')
         return render(request, 'referencing_master.html', {'references': [], 'total_references': 0})
 
@@ -800,37 +946,38 @@ def create_reference(request):
     """Create a new reference entry"""
     if request.method == 'POST':
         try:
-            referencing_style = request.POST.get('referencing_style', '').strip()
-            used_in = request.POST.get('used_in', '').strip()
-            
+            referencing_style, used_in = _parse_reference_form(request.POST)
+
             # Validation
             if not referencing_style or not used_in:
                 messages.error(request, 'All fields are required.')
                 return redirect('referencing_master')
             
-            # Check for existing combination
-            all_matching = list(ReferencingMaster.objects.filter(
-                referencing_style=referencing_style,
-                used_in=used_in
-            ))
-            
-            existing = next(
-                (item for item in all_matching if not getattr(item, 'is_deleted', False)),
-                None
-            )
-            
-            if existing:
+            # Check for existing combination (soft-delete check in
+            # Python, Djongo-safe): the is_deleted lookup kwarg the old
+            # get_or_create carried compiles to a NOT clause djongo
+            # cannot parse. The Mongo partial unique index from
+            # migration 0013 guards the concurrent-create race.
+            if any(
+                not other.is_deleted
+                for other in ReferencingMaster.objects.filter(
+                    referencing_style=referencing_style,
+                    used_in=used_in,
+                ).only('is_deleted')
+            ):
                 messages.error(request, f'Reference already exists for {referencing_style} - {used_in}.')
                 return redirect('referencing_master')
-            
+
             with transaction.atomic():
-                reference_obj = ReferencingMaster()
-                reference_obj.referencing_style = referencing_style
-                reference_obj.used_in = used_in
-                reference_obj.created_by = request.user
-                reference_obj.created_at = timezone.now()
-                reference_obj.save()
-                
+                reference_obj = ReferencingMaster.objects.create(
+                    referencing_style=referencing_style,
+                    used_in=used_in,
+                    created_by=request.user,
+                    created_at=timezone.now(),
+                )
+
+                _adjust_reference_count(+1)
+
                 log_activity_event(
                     'reference.created_at',
                     subject_user=None,
@@ -842,13 +989,13 @@ def create_reference(request):
                     },
                 )
                 
-                logger.info(f"Reference created for {referencing_style} - {used_in} by {request.user.email}")
+                logger.info("Reference created for %s - %s by %s", referencing_style, used_in, request.user.email)
                 messages.success(request, f'Reference for {referencing_style} - {used_in} created successfully!')
             
             return redirect('referencing_master')
             
         except Exception as e:
-            logger.exception(f"Error creating reference: {str(e)}")
+            logger.exception("Error creating reference: %s", e)
             messages.error(request, 'An error occurred while creating the reference.')
             return redirect('referencing_master')
     
@@ -869,26 +1016,22 @@ def edit_reference(request, reference_id):
         return redirect('referencing_master')
     
     try:
-        referencing_style = request.POST.get('referencing_style', '').strip()
-        used_in = request.POST.get('used_in', '').strip()
-        
+        referencing_style, used_in = _parse_reference_form(request.POST)
+
         if not referencing_style or not used_in:
             messages.error(request, 'All fields are required.')
             return redirect('referencing_master')
         
-        # Check for duplicate combination (excluding current record)
-        all_matching = list(ReferencingMaster.objects.filter(
+        # Check for duplicate combination (excluding current record);
+        # soft-delete and self checks happen in Python (Djongo-safe)
+        candidates = ReferencingMaster.objects.filter(
             referencing_style=referencing_style,
-            used_in=used_in
-        ))
-        
-        existing = next(
-            (item for item in all_matching 
-             if str(item.id) != str(reference_id) and not getattr(item, 'is_deleted', False)),
-            None
-        )
-        
-        if existing:
+            used_in=used_in,
+        ).only('is_deleted')
+        if any(
+            not ref.is_deleted and ref.id != reference_obj.id
+            for ref in candidates
+        ):
             messages.error(request, f'Reference already exists for {referencing_style} - {used_in}.')
             return redirect('referencing_master')
         
@@ -897,9 +1040,17 @@ def edit_reference(request, reference_id):
             reference_obj.used_in = used_in
             reference_obj.updated_by = request.user
             reference_obj.updated_at = timezone.now()
-            reference_obj.save()
-            
-            log_activity_event(
+            reference_obj.save(update_fields=[
+                'referencing_style',
+                'used_in',
+                'updated_by',
+                'updated_at',
+            ])
+            # Zero delta still refreshes the stats row's last_updated,
+            # which the list view's ETag/Last-Modified validators read.
+            _adjust_reference_count(0)
+
+            queue_activity_event(
                 'reference.updated_at',
                 subject_user=None,
                 performed_by=request.user,
@@ -913,7 +1064,7 @@ def edit_reference(request, reference_id):
         messages.success(request, f'Reference for {referencing_style} - {used_in} updated successfully.')
     
     except Exception as e:
-        logger.exception(f"Error updating reference: {str(e)}")
+        logger.exception("Error updating reference: %s", e)
         messages.error(request, 'An error occurred while updating the reference.')
     
     return redirect('referencing_master')
@@ -937,24 +1088,31 @@ def delete_reference(request, reference_id):
     used_in_ref = reference_obj.used_in
     
     try:
-        with transaction.atomic():
-            reference_obj.delete()
-            
-            log_activity_event(
-                'reference.deleted',
-                subject_user=None,
-                performed_by=request.user,
-                metadata={
-                    'reference_id': reference_id_ref,
-                    'referencing_style': referencing_style_ref,
-                    'used_in': used_in_ref,
-                },
-            )
-        
+        # Single-row soft delete: no multi-statement invariant to protect, so
+        # no explicit transaction. Cache invalidation and the audit event
+        # still run via on_commit, which fires immediately in autocommit mode.
+        ReferencingMaster.objects.filter(pk=reference_obj.pk).update(
+            is_deleted=True,
+            deleted_at=timezone.now(),
+            deleted_by=request.user,
+        )
+        _adjust_reference_count(-1)
+
+        queue_activity_event(
+            'reference.deleted',
+            subject_user=None,
+            performed_by=request.user,
+            metadata={
+                'reference_id': reference_id_ref,
+                'referencing_style': referencing_style_ref,
+                'used_in': used_in_ref,
+            },
+        )
+
         messages.success(request, f'Reference for {referencing_style_ref} - {used_in_ref} deleted successfully.')
     
     except Exception as e:
-        logger.exception(f"Error deleting reference: {str(e)}")
+        logger.exception("Error deleting reference: %s", e)
         messages.error(request, 'An error occurred while deleting the reference.')
     
     return redirect('referencing_master')
@@ -962,32 +1120,16 @@ def delete_reference(request, reference_id):
 
 def _find_reference_by_id(reference_id):
     """Helper function to find reference by ID (supports ObjectId and int)"""
-    if not reference_id:
+    lookup_value = _coerce_id(reference_id)
+    if lookup_value is None:
         return None
-    
-    candidates = []
-    try:
-        candidates = list(ReferencingMaster.objects.filter(id=reference_id))
-    except Exception:
-        candidates = []
-    
-    if not candidates and isinstance(reference_id, str) and reference_id.isdigit():
-        try:
-            candidates = list(ReferencingMaster.objects.filter(id=int(reference_id)))
-        except Exception:
-            candidates = []
-    
-    if not candidates:
-        try:
-            object_id = ObjectId(str(reference_id))
-            candidates = list(ReferencingMaster.objects.filter(id=object_id))
-        except (InvalidId, Exception):
-            candidates = []
-    
-    return next(
-        (item for item in candidates if not getattr(item, 'is_deleted', False)),
-        None
-    )
+
+    # Djongo-safe lookup: fetch by id alone and apply the soft-delete
+    # check in Python.
+    reference = ReferencingMaster.objects.filter(id=lookup_value).first()
+    if reference is None or reference.is_deleted:
+        return None
+    return reference
 
 
 
@@ -998,22 +1140,61 @@ def _find_reference_by_id(reference_id):
 # ACADEMIC WRITING MASTER VIEWS
 # ========================================
 
+def _master_list_version(name):
+    """Current cache version for a master table's list; seeds on first use."""
+    token = cache.get(f'{name}_master_ver')
+    if token is None:
+        token = timezone.now().timestamp()
+        cache.set(f'{name}_master_ver', token, None)
+    return token
+
+
+def _bump_master_list_version(name):
+    """Invalidate a master table's cached list once the write commits."""
+    transaction.on_commit(
+        lambda: cache.set(f'{name}_master_ver', timezone.now().timestamp(), None)
+    )
+
+
+def _cached_master_list(name, build):
+    """Versioned read-through cache: stale keys die with their token."""
+    version = _master_list_version(name)
+    return cache.get_or_set(f'{name}_master_list:{version}', build, 300)
+
+
 @login_required
 @superadmin_required
 def academic_writing_master(request):
     """Academic Writing Master - List all writing styles"""
+    return _render_writing_list(request)
+
+
+def _render_writing_list(request, error=None):
+    """
+    Render the writing list page, optionally with a validation error.
+
+    Failed create/edit submissions call this directly instead of
+    redirecting, which saves the browser's second GET re-running the view.
+    """
+    if error:
+        messages.error(request, error)
     try:
-        raw_writings = list(AcademicWritingMaster.objects.all().order_by('-created_at'))
-        writings = [
-            writing for writing in raw_writings
-            if not getattr(writing, 'is_deleted', False)
-        ]
+        # Djongo-safe: drop soft-deleted rows in Python; a DB-side
+        # is_deleted predicate compiles to WHERE NOT, which djongo
+        # cannot parse.
+        writings = _cached_master_list('writings', lambda: [
+            writing
+            for writing in AcademicWritingMaster.objects
+            .only('writing_style', 'created_at', 'is_deleted')
+            .order_by('-created_at')
+            if not writing.is_deleted
+        ])
         context = {
             'writings': writings,
             'total_writings': len(writings),
         }
         return render(request, 'academic_writing_master.html', context)
-        
+
     except Exception as e:
         logger.exception(f"Error loading academic writing master: {str(e)}")
         messages.error(request, 'Error loading writing styles.')
@@ -1030,22 +1211,17 @@ def create_writing(request):
             
             # Validation
             if not writing_style:
-                messages.error(request, 'Writing style is required.')
-                return redirect('academic_writing_master')
-            
-            # Check for existing writing style
-            all_matching = list(AcademicWritingMaster.objects.filter(
-                writing_style=writing_style
-            ))
-            
-            existing = next(
-                (item for item in all_matching if not getattr(item, 'is_deleted', False)),
-                None
-            )
-            
-            if existing:
-                messages.error(request, f'Writing style "{writing_style}" already exists.')
-                return redirect('academic_writing_master')
+                return _render_writing_list(request, 'Writing style is required.')
+
+            # Check for existing writing style (Djongo-safe: the
+            # soft-delete check runs in Python)
+            if any(
+                not writing.is_deleted
+                for writing in AcademicWritingMaster.objects.filter(
+                    writing_style=writing_style,
+                ).only('is_deleted')
+            ):
+                return _render_writing_list(request, f'Writing style "{writing_style}" already exists.')
             
             with transaction.atomic():
                 writing_obj = AcademicWritingMaster()
@@ -1063,12 +1239,13 @@ def create_writing(request):
                         'writing_style': writing_style,
                     },
                 )
-                
+                _bump_master_list_version('writings')
+
                 logger.info(f"Writing style '{writing_style}' created by {request.user.email}")
                 messages.success(request, f'Writing style "{writing_style}" created successfully!')
             
             return redirect('academic_writing_master')
-            
+
         except Exception as e:
             logger.exception(f"Error creating writing style: {str(e)}")
             messages.error(request, 'An error occurred while creating the writing style.')
@@ -1094,29 +1271,23 @@ def edit_writing(request, writing_id):
         writing_style = request.POST.get('writing_style', '').strip()
         
         if not writing_style:
-            messages.error(request, 'Writing style is required.')
-            return redirect('academic_writing_master')
-        
-        # Check for duplicate (excluding current record)
-        all_matching = list(AcademicWritingMaster.objects.filter(
-            writing_style=writing_style
-        ))
-        
-        existing = next(
-            (item for item in all_matching 
-             if str(item.id) != str(writing_id) and not getattr(item, 'is_deleted', False)),
-            None
-        )
-        
-        if existing:
-            messages.error(request, f'Writing style "{writing_style}" already exists.')
-            return redirect('academic_writing_master')
+            return _render_writing_list(request, 'Writing style is required.')
+
+        # Check for duplicate (excluding current record; soft-delete and
+        # self checks in Python, Djongo-safe)
+        if any(
+            not writing.is_deleted and writing.id != writing_obj.id
+            for writing in AcademicWritingMaster.objects.filter(
+                writing_style=writing_style,
+            ).only('is_deleted')
+        ):
+            return _render_writing_list(request, f'Writing style "{writing_style}" already exists.')
         
         with transaction.atomic():
             writing_obj.writing_style = writing_style
             writing_obj.updated_by = request.user
             writing_obj.updated_at = timezone.now()
-            writing_obj.save()
+            writing_obj.save(update_fields=['writing_style', 'updated_by', 'updated_at'])
             
             log_activity_event(
                 'writing.updated_at',
@@ -1127,7 +1298,8 @@ def edit_writing(request, writing_id):
                     'writing_style': writing_style,
                 },
             )
-        
+            _bump_master_list_version('writings')
+
         messages.success(request, f'Writing style "{writing_style}" updated successfully.')
     
     except Exception as e:
@@ -1166,7 +1338,8 @@ def delete_writing(request, writing_id):
                     'writing_style': writing_style_ref,
                 },
             )
-        
+            _bump_master_list_version('writings')
+
         messages.success(request, f'Writing style "{writing_style_ref}" deleted successfully.')
     
     except Exception as e:
@@ -1178,43 +1351,30 @@ def delete_writing(request, writing_id):
 
 def _find_writing_by_id(writing_id):
     """Helper function to find writing by ID (supports ObjectId and int)"""
-    if not writing_id:
+    lookup_value = _coerce_id(writing_id)
+    if lookup_value is None:
         return None
-    
-    candidates = []
-    try:
-        candidates = list(AcademicWritingMaster.objects.filter(id=writing_id))
-    except Exception:
-        candidates = []
-    
-    if not candidates and isinstance(writing_id, str) and writing_id.isdigit():
-        try:
-            candidates = list(AcademicWritingMaster.objects.filter(id=int(writing_id)))
-        except Exception:
-            candidates = []
-    
-    if not candidates:
-        try:
-            object_id = ObjectId(str(writing_id))
-            candidates = list(AcademicWritingMaster.objects.filter(id=object_id))
-        except (InvalidId, Exception):
-            candidates = []
-    
-    return next(
-        (item for item in candidates if not getattr(item, 'is_deleted', False)),
-        None
-    )
+
+    # Djongo-safe: single id lookup, soft-delete check in Python.
+    writing = AcademicWritingMaster.objects.filter(id=lookup_value).first()
+    if writing is None or writing.is_deleted:
+        return None
+    return writing
 
 @login_required
 @superadmin_required
 def project_group_master(request):
     """Project Group Master - List all project groups (Djongo-safe)"""
     try:
-        raw_groups = list(ProjectGroupMaster.objects.all().order_by('-created_at'))
-        project_groups = [
-            group for group in raw_groups
-            if not getattr(group, 'is_deleted', False)
-        ]
+        # Djongo-safe: soft-delete filtering happens in Python, see
+        # _render_writing_list.
+        project_groups = _cached_master_list('groups', lambda: [
+            group
+            for group in ProjectGroupMaster.objects
+            .only('project_group_name', 'project_group_prefix', 'created_at', 'is_deleted')
+            .order_by('-created_at')
+            if not group.is_deleted
+        ])
         context = {
             'project_groups': project_groups,
             'total_groups': len(project_groups),
@@ -1249,18 +1409,14 @@ def create_project_group(request):
                 messages.error(request, 'Project Group Prefix must contain only letters and numbers.')
                 return redirect('project_group_master')
             
-            # Check for existing prefix (Djongo-safe approach)
-            all_matching = list(ProjectGroupMaster.objects.filter(
-                project_group_prefix=project_group_prefix
-            ))
-            
-            # Filter in Python to avoid Djongo NOT operator issues
-            existing = next(
-                (item for item in all_matching if not getattr(item, 'is_deleted', False)),
-                None
-            )
-            
-            if existing:
+            # Check for existing prefix (Djongo-safe: the soft-delete
+            # check runs in Python)
+            if any(
+                not group.is_deleted
+                for group in ProjectGroupMaster.objects.filter(
+                    project_group_prefix=project_group_prefix,
+                ).only('is_deleted')
+            ):
                 messages.error(request, f'Project Group with prefix "{project_group_prefix}" already exists.')
                 return redirect('project_group_master')
             
@@ -1282,7 +1438,8 @@ def create_project_group(request):
                         'project_group_prefix': project_group_prefix,
                     },
                 )
-                
+                _bump_master_list_version('groups')
+
                 logger.info(f"Project Group '{project_group_name}' created by {request.user.email}")
                 messages.success(request, f'Project Group "{project_group_name}" created successfully!')
             
@@ -1303,14 +1460,10 @@ def edit_project_group(request, group_id):
     if request.method != 'POST':
         return redirect('project_group_master')
     
-    # Djongo-safe lookup
-    all_groups = list(ProjectGroupMaster.objects.filter(id=group_id))
-    group = next(
-        (item for item in all_groups if not getattr(item, 'is_deleted', False)),
-        None
-    )
-    
-    if not group:
+    # Djongo-safe lookup, as in edit_holiday.
+    group = ProjectGroupMaster.objects.filter(id=group_id).first()
+
+    if not group or group.is_deleted:
         messages.error(request, 'Project Group not found.')
         return redirect('project_group_master')
     
@@ -1327,19 +1480,14 @@ def edit_project_group(request, group_id):
             messages.error(request, 'Project Group Prefix must contain only letters and numbers.')
             return redirect('project_group_master')
         
-        # Check for duplicate prefix (excluding current record) - Djongo-safe
-        all_matching = list(ProjectGroupMaster.objects.filter(
-            project_group_prefix=project_group_prefix
-        ))
-        
-        # Filter in Python to avoid Djongo issues
-        existing = next(
-            (item for item in all_matching 
-             if item.id != group_id and not getattr(item, 'is_deleted', False)),
-            None
-        )
-        
-        if existing:
+        # Check for duplicate prefix (excluding current record;
+        # soft-delete and self checks in Python, Djongo-safe)
+        if any(
+            not other.is_deleted and other.id != group.id
+            for other in ProjectGroupMaster.objects.filter(
+                project_group_prefix=project_group_prefix,
+            ).only('is_deleted')
+        ):
             messages.error(request, f'Project Group with prefix "{project_group_prefix}" already exists.')
             return redirect('project_group_master')
         
@@ -1348,7 +1496,12 @@ def edit_project_group(request, group_id):
             group.project_group_prefix = project_group_prefix
             group.updated_by = request.user
             group.updated_at = timezone.now()
-            group.save()
+            group.save(update_fields=[
+                'project_group_name',
+                'project_group_prefix',
+                'updated_by',
+                'updated_at',
+            ])
             
             log_activity_event(
                 'project_group.updated_at',
@@ -1360,7 +1513,8 @@ def edit_project_group(request, group_id):
                     'project_group_prefix': project_group_prefix,
                 },
             )
-        
+            _bump_master_list_version('groups')
+
         messages.success(request, f'Project Group "{project_group_name}" updated successfully.')
     except Exception as e:
         logger.exception(f"Error updating project group: {str(e)}")
@@ -1402,7 +1556,8 @@ def delete_project_group(request, group_id):
                     'project_group_prefix': group_prefix_ref,
                 },
             )
-        
+            _bump_master_list_version('groups')
+
         messages.success(request, f'Project Group "{group_name_ref}" deleted successfully.')
     except Exception as e:
         logger.exception(f"Error deleting project group: {str(e)}")
@@ -1419,11 +1574,21 @@ def delete_project_group(request, group_id):
 def template_master(request):
     """Template Master - List all templates"""
     try:
-        raw_templates = list(TemplateMaster.objects.all().order_by('-created_at'))
-        templates = [
-            template for template in raw_templates
-            if not getattr(template, 'is_deleted', False)
-        ]
+        # Project away the JSON blobs (default_tasks, visibility_config):
+        # the list page never renders them and they dominate row size.
+        # Soft-delete filtering happens in Python (Djongo-safe), and the
+        # annotated jobs_count is gone -- djongo cannot parse the
+        # GROUP BY it compiled to, and the list page never rendered it.
+        templates = _cached_master_list('templates', lambda: [
+            template
+            for template in TemplateMaster.objects
+            .select_related('created_by')
+            .only('template_name', 'template_description', 'status',
+                  'created_at', 'is_deleted',
+                  'created_by__first_name', 'created_by__last_name')
+            .order_by('-created_at')
+            if not template.is_deleted
+        ])
         context = {
             'templates': templates,
             'total_templates': len(templates),
@@ -1453,16 +1618,14 @@ def create_template(request):
                 messages.error(request, 'Template name is required.')
                 return redirect('template_master')
             
-            # Check for existing template without triggering Djongo NOT recursion
-            existing = next(
-                (
-                    item for item in TemplateMaster.objects.filter(template_name=template_name)
-                    if not getattr(item, 'is_deleted', False)
-                ),
-                None
-            )
-            
-            if existing:
+            # Check for existing template (Djongo-safe: the soft-delete
+            # check runs in Python)
+            if any(
+                not template.is_deleted
+                for template in TemplateMaster.objects.filter(
+                    template_name=template_name,
+                ).only('is_deleted')
+            ):
                 messages.error(request, f'Template "{template_name}" already exists.')
                 return redirect('template_master')
             
@@ -1498,12 +1661,13 @@ def create_template(request):
                         'template_name': template_name,
                     },
                 )
-                
+                _bump_master_list_version('templates')
+
                 logger.info(f"Template '{template_name}' created by {request.user.email}")
                 messages.success(request, f'Template "{template_name}" created successfully!')
             
             return redirect('template_master')
-            
+
         except Exception as e:
             logger.exception(f"Error creating template: {str(e)}")
             messages.error(request, 'An error occurred while creating the template.')
@@ -1519,52 +1683,62 @@ def edit_template(request, template_id):
     if request.method != 'POST':
         return redirect('template_master')
     
-    template = TemplateMaster.objects.filter(
-        id=template_id,
-        is_deleted=False
-    ).first()
-    
-    if not template:
-        messages.error(request, 'Template not found.')
-        return redirect('template_master')
-    
     try:
         template_name = request.POST.get('template_name', '').strip()
         template_description = request.POST.get('template_description', '').strip()
         status = request.POST.get('status', 'active')
-        
+
         if not template_name:
             messages.error(request, 'Template name is required.')
             return redirect('template_master')
-        
-        # Check for duplicate (excluding current)
-        existing = TemplateMaster.objects.filter(
-            template_name=template_name,
-            is_deleted=False
-        ).exclude(id=template_id).first()
-        
-        if existing:
+
+        # Check for duplicate (excluding current; soft-delete and self
+        # checks in Python, Djongo-safe)
+        if any(
+            not template.is_deleted and str(template.id) != str(template_id)
+            for template in TemplateMaster.objects.filter(
+                template_name=template_name,
+            ).only('is_deleted')
+        ):
             messages.error(request, f'Template "{template_name}" already exists.')
             return redirect('template_master')
-        
+
+        # Djongo-safe lookup first (the folded id + is_deleted UPDATE
+        # predicate fails djongo's parser), then a narrow save.
+        lookup_value = _coerce_id(template_id)
+        template = (
+            TemplateMaster.objects.filter(id=lookup_value).first()
+            if lookup_value is not None else None
+        )
+        if template is None or template.is_deleted:
+            messages.error(request, 'Template not found.')
+            return redirect('template_master')
+
         with transaction.atomic():
             template.template_name = template_name
             template.template_description = template_description
             template.status = status
             template.updated_by = request.user
             template.updated_at = timezone.now()
-            template.save()
-            
+            template.save(update_fields=[
+                'template_name',
+                'template_description',
+                'status',
+                'updated_by',
+                'updated_at',
+            ])
+
             log_activity_event(
                 'template.updated_at',
                 subject_user=None,
                 performed_by=request.user,
                 metadata={
-                    'template_id': str(template.id),
+                    'template_id': str(template_id),
                     'template_name': template_name,
                 },
             )
-        
+            _bump_master_list_version('templates')
+
         messages.success(request, f'Template "{template_name}" updated successfully.')
     
     except Exception as e:
@@ -1587,11 +1761,9 @@ def delete_template(request, template_id):
         messages.error(request, 'Template not found.')
         return redirect('template_master')
     
-    # Check if template is being used
-    from marketing.models import Job
-    jobs_using_template = Job.objects.filter(template=template).count()
-    
-    if jobs_using_template > 0:
+    # Check if template is being used; only count when the message needs it
+    if Job.objects.filter(template=template).exists():
+        jobs_using_template = Job.objects.filter(template=template).count()
         messages.error(
             request,
             f'Cannot delete template. It is currently being used by {jobs_using_template} job(s).'
@@ -1613,7 +1785,8 @@ def delete_template(request, template_id):
                     'template_name': template_name_ref,
                 },
             )
-        
+            _bump_master_list_version('templates')
+
         messages.success(request, f'Template "{template_name_ref}" deleted successfully.')
     
     except Exception as e:
@@ -1650,9 +1823,7 @@ def add_user(request):
                 errors.append('Please enter a valid full name.')
             
             # Email validation
-            import re
-            email_regex = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_regex, email):
+            if not _EMAIL_RE.match(email):
                 errors.append('Please enter a valid email address.')
             
             # Check if email already exists
@@ -1683,20 +1854,27 @@ def add_user(request):
             
             # Create user
             with transaction.atomic():
-                # Generate unique username
-                username = email.split('@')[0]
-                base_username = username
+                # Generate unique username: one range query fetches every
+                # taken name with this prefix, then the suffix search runs
+                # against an in-memory set instead of one query per attempt.
+                base_username = email.split('@')[0]
+                taken = set(
+                    CustomUser.objects.filter(username__startswith=base_username)
+                    .values_list('username', flat=True)
+                )
+                username = base_username
                 counter = 1
-                
-                while CustomUser.objects.filter(username=username).exists():
+                while username in taken:
                     username = f"{base_username}{counter}"
                     counter += 1
                 
                 # Create timestamp
                 now = timezone.now()
                 
-                # Create user
-                user = CustomUser.objects.create(
+                # Build the user fully before hitting the database so it
+                # lands in one INSERT instead of a create() plus a second
+                # full-row save.
+                user = CustomUser(
                     username=username,
                     email=email,
                     first_name=first_name,
@@ -1714,42 +1892,42 @@ def add_user(request):
                     role_assigned_at=now,
                 )
                 user.set_password(password1)
-                
+
                 # Generate employee ID
                 user.employee_id = user.generate_employee_id()
                 user.employee_id_generated_at = now
                 user.employee_id_assigned_at = now
-                
+
                 user.save()
                 
-                # Log activity
-                log_activity_event(
-                    'user.created_by_superadmin',
-                    subject_user=user,
-                    performed_by=request.user,
-                    metadata={
-                        'role': role,
-                        'employee_id': user.employee_id,
-                        'created_via': 'add_user_form'
+                # Log all three lifecycle events in one bulk insert
+                log_activity_events([
+                    {
+                        'event_key': 'user.created_by_superadmin',
+                        'subject_user': user,
+                        'performed_by': request.user,
+                        'metadata': {
+                            'role': role,
+                            'employee_id': user.employee_id,
+                            'created_via': 'add_user_form',
+                        },
                     },
-                )
-                
-                log_activity_event(
-                    'user.approved_at',
-                    subject_user=user,
-                    performed_by=request.user,
-                    metadata={'auto_approved': True},
-                )
-                
-                log_activity_event(
-                    'employee_id.generated_at',
-                    subject_user=user,
-                    metadata={
-                        'employee_id': user.employee_id,
-                        'source': 'add_user_form',
-                        'performed_by': 'superadmin',
+                    {
+                        'event_key': 'user.approved_at',
+                        'subject_user': user,
+                        'performed_by': request.user,
+                        'metadata': {'auto_approved': True},
                     },
-                )
+                    {
+                        'event_key': 'employee_id.generated_at',
+                        'subject_user': user,
+                        'metadata': {
+                            'employee_id': user.employee_id,
+                            'source': 'add_user_form',
+                            'performed_by': 'superadmin',
+                        },
+                    },
+                ])
                 
                 logger.info(f"User created by superadmin: {user.email} with role {role}")
                 messages.success(request, f'User "{user.get_full_name()}" created successfully with Employee ID: {user.employee_id}')
@@ -1784,7 +1962,7 @@ def change_user_password(request, user_id):
     new_password = request.POST.get('new_password', '').strip()
     copy_confirmed = request.POST.get('copy_confirmed', 'false').lower() == 'true'
     
-    logger.info(f"Password change attempt (generated) for user: {target_user.email}")
+    logger.info("Password change attempt (generated) for user: %s", target_user.email)
     
     if not new_password:
         messages.error(request, 'Generated password is missing. Please try again.')
@@ -1807,7 +1985,7 @@ def change_user_password(request, user_id):
             target_user.password_changed_at = change_timestamp
             target_user.save()
             
-            logger.info(f"Password successfully changed for user: {target_user.email}")
+            logger.info("Password successfully changed for user: %s", target_user.email)
             
             log_activity_event(
                 'user.password_changed_at',
@@ -1829,35 +2007,18 @@ def change_user_password(request, user_id):
                 f'Share the copied password with the user.'
             )
             
-            try:
-                from django.core.mail import send_mail
-                from django.conf import settings
-                
-                send_mail(
-                    subject='Password Changed - CRM System',
-                    message=f'''
-Dear {target_user.get_full_name()},
-
-Your password has been reset by the system administrator.
-
-If you did not request this change, please contact the administrator immediately.
-
-Changed by: {request.user.get_full_name()}
-Time: {change_timestamp.strftime('%Y-%m-%d %H:%M:%S')}
-
-Best regards,
-CRM System Team
-                    ''',
-                    from_email=settings.DEFAULT_FROM_EMAIL,
-                    recipient_list=[target_user.email],
-                    fail_silently=True,
-                )
-                logger.info(f"Password change notification email sent to {target_user.email}")
-            except Exception as email_error:
-                logger.warning(f"Failed to send password change email: {str(email_error)}")
+            # Notify on a worker thread once the change commits; the
+            # response no longer waits on the SMTP handshake.
+            transaction.on_commit(functools.partial(
+                queue_password_changed_email,
+                target_user.email,
+                target_user.get_full_name(),
+                request.user.get_full_name(),
+                change_timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+            ))
     
     except Exception as e:
-        logger.exception(f"Error changing password for user {user_id}: {str(e)}")
+        logger.exception("Error changing password for user %s: %s", user_id, e)
         messages.error(
             request,
             f' An unexpected error occurred while changing the password: {str(e)}. '
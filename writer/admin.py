@@ -10,6 +10,18 @@ class WriterProjectAdmin(admin.ModelAdmin):
     search_fields = ['job_id', 'topic', 'writer__email', 'writer__first_name', 'writer__last_name']
     ordering = ['-created_at']
     date_hierarchy = 'created_at'
+    list_select_related = ['writer']
+
+    def get_queryset(self, request):
+        # Changelist doesn't need the file columns or long instruction
+        # fields; join the writer and fetch only what the rows display.
+        # The topic stays in the projection: djongo cannot parse the
+        # SUBSTRING a DB-side truncation would compile to, so topic_short
+        # slices it in Python.
+        return super().get_queryset(request).select_related('writer').only(
+            'job_id', 'topic', 'word_count', 'deadline', 'status', 'created_at',
+            'writer__first_name', 'writer__last_name', 'writer__email',
+        )
     
     fieldsets = (
         ('Job Information', {
@@ -44,6 +56,7 @@ class ProjectIssueAdmin(admin.ModelAdmin):
     search_fields = ['title', 'description', 'project__job_id']
     ordering = ['-created_at']
     date_hierarchy = 'created_at'
+    list_select_related = ['project', 'reported_by', 'assigned_to']
     
     fieldsets = (
         ('Issue Details', {
@@ -71,7 +84,8 @@ class ProjectCommentAdmin(admin.ModelAdmin):
     search_fields = ['project__job_id', 'user__email', 'comment']
     ordering = ['-created_at']
     date_hierarchy = 'created_at'
-    
+    list_select_related = ['project', 'user']
+
     def comment_short(self, obj):
         return obj.comment[:50] + '...' if len(obj.comment) > 50 else obj.comment
     comment_short.short_description = 'Comment'
@@ -84,6 +98,7 @@ class WriterStatisticsAdmin(admin.ModelAdmin):
     list_filter = ['last_updated']
     search_fields = ['writer__email', 'writer__first_name', 'writer__last_name']
     ordering = ['-last_updated']
+    list_select_related = ['writer']
     
     fieldsets = (
         ('Writer', {
@@ -1,6 +1,28 @@
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
 from django.apps import AppConfig
 
 
 class WriterConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'writer'
+
+    def ready(self):
+        """Route the 'writer' logger through a queue.
+
+        The write views log on the hot path; with a plain FileHandler each
+        call blocks on disk I/O. Hand the configured handlers to a
+        QueueListener thread so the request thread only enqueues records.
+        """
+        log = logging.getLogger('writer')
+        handlers = [h for h in log.handlers if not isinstance(h, QueueHandler)]
+        if not handlers:
+            return
+        record_queue = queue.Queue(-1)
+        log.handlers = [QueueHandler(record_queue)]
+        listener = QueueListener(record_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
@@ -0,0 +1,33 @@
+# Generated by Django 3.1.12 on 2026-08-30 09:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('writer', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='projectcomment',
+            index=models.Index(fields=['project', '-created_at'], name='comment_project_created'),
+        ),
+        migrations.AddIndex(
+            model_name='projectissue',
+            index=models.Index(fields=['project', '-created_at'], name='issue_project_created'),
+        ),
+        migrations.AddIndex(
+            model_name='writerproject',
+            index=models.Index(fields=['writer', 'status'], name='wp_writer_status'),
+        ),
+        migrations.AddIndex(
+            model_name='writerproject',
+            index=models.Index(fields=['writer', 'status', '-created_at'], name='wp_writer_status_ct'),
+        ),
+        migrations.AddIndex(
+            model_name='writerproject',
+            index=models.Index(fields=['writer', '-completed_at'], name='wp_writer_compl'),
+        ),
+    ]
@@ -9,17 +9,25 @@ except ImportError:  # pragma: no cover
     BsonDecimal128 = None
 
 
+# Shared status vocabulary, built once at import time. Views filter with
+# the frozensets; templates and serializers get O(1) label lookups.
+STATUS_CHOICES = [
+    ('pending', 'Pending'),
+    ('in_progress', 'In Progress'),
+    ('completed', 'Completed'),
+    ('hold', 'Hold'),
+    ('issues', 'Issues'),
+    ('closed', 'Closed'),
+]
+STATUS_LABELS = dict(STATUS_CHOICES)
+ACTIVE_STATUSES = frozenset({'pending', 'in_progress', 'hold', 'issues'})
+COMPLETED_STATUSES = frozenset({'completed', 'closed'})
+
+
 class WriterProject(models.Model):
     """Writer Project Model"""
     
-    STATUS_CHOICES = [
-        ('pending', 'Pending'),
-        ('in_progress', 'In Progress'),
-        ('completed', 'Completed'),
-        ('hold', 'Hold'),
-        ('issues', 'Issues'),
-        ('closed', 'Closed'),
-    ]
+    STATUS_CHOICES = STATUS_CHOICES
     
     REFERENCING_CHOICES = [
         ('apa', 'APA'),
@@ -78,6 +86,11 @@ class WriterProject(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Writer Project'
         verbose_name_plural = 'Writer Projects'
+        indexes = [
+            models.Index(fields=['writer', 'status'], name='wp_writer_status'),
+            models.Index(fields=['writer', 'status', '-created_at'], name='wp_writer_status_ct'),
+            models.Index(fields=['writer', '-completed_at'], name='wp_writer_compl'),
+        ]
     
     def __str__(self):
         return f"{self.job_id} - {self.writer.get_full_name()}"
@@ -87,13 +100,18 @@ class WriterProject(models.Model):
         if not self.started_at:
             self.started_at = timezone.now()
         self.status = 'in_progress'
-        self.save()
+        self.save(update_fields=['status', 'started_at', 'updated_at'])
     
-    def mark_completed(self):
-        """Mark project as completed"""
+    def mark_completed(self, extra_update_fields=()):
+        """Mark project as completed.
+
+        ``extra_update_fields`` lets callers persist fields they assigned
+        just before completing (e.g. the submission details) in the same
+        narrow write.
+        """
         self.status = 'completed'
         self.completed_at = timezone.now()
-        self.save()
+        self.save(update_fields=['status', 'completed_at', 'updated_at', *extra_update_fields])
     
     def is_overdue(self):
         """Check if project is overdue"""
@@ -169,6 +187,9 @@ class ProjectIssue(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Project Issue'
         verbose_name_plural = 'Project Issues'
+        indexes = [
+            models.Index(fields=['project', '-created_at'], name='issue_project_created'),
+        ]
     
     def __str__(self):
         return f"{self.project.job_id} - {self.title}"
@@ -179,7 +200,9 @@ class ProjectIssue(models.Model):
         self.resolved_by = resolved_by
         self.resolved_at = timezone.now()
         self.resolution_notes = notes
-        self.save()
+        self.save(update_fields=[
+            'status', 'resolved_by', 'resolved_at', 'resolution_notes', 'updated_at',
+        ])
 
 
 class ProjectComment(models.Model):
@@ -204,6 +227,9 @@ class ProjectComment(models.Model):
         ordering = ['created_at']
         verbose_name = 'Project Comment'
         verbose_name_plural = 'Project Comments'
+        indexes = [
+            models.Index(fields=['project', '-created_at'], name='comment_project_created'),
+        ]
     
     def __str__(self):
         return f"{self.user.get_full_name()} on {self.project.job_id}"
@@ -250,46 +276,61 @@ class WriterStatistics(models.Model):
         Return a single statistics row for the given writer, deleting any accidental duplicates.
         Djongo doesn't always enforce the one-to-one constraint, so we consolidate here.
         """
-        stats = list(cls.objects.filter(writer=writer).order_by('id'))
-        if stats:
-            primary = stats[0]
-            if len(stats) > 1:
-                cls.objects.filter(id__in=[s.id for s in stats[1:]]).delete()
-            return primary, False
-        return cls.objects.create(writer=writer), True
+        qs = cls.objects.filter(writer=writer).order_by('id')
+        primary = qs.first()
+        if primary is None:
+            return cls.objects.create(writer=writer), True
+        # Dedup only when a second row actually exists; reading two ids is
+        # far cheaper than materializing every duplicate as a full model.
+        ids = list(qs.values_list('id', flat=True)[:2])
+        if len(ids) > 1:
+            cls.objects.filter(writer=writer).exclude(pk=primary.pk).delete()
+        return primary, False
     
     def _normalize_average_rating(self):
         """Ensure average_rating is stored as Decimal for Djongo compatibility."""
         value = self.average_rating
-        if BsonDecimal128 and isinstance(value, BsonDecimal128):
-            self.average_rating = value.to_decimal()
-        elif isinstance(value, str):
+        if isinstance(value, Decimal):
+            # Common case: already a Decimal, nothing to convert.
+            return
+        if isinstance(value, str):
             self.average_rating = Decimal(value or '0')
         elif isinstance(value, (int, float)):
             self.average_rating = Decimal(str(value))
         elif value is None:
             self.average_rating = Decimal('0')
+        elif BsonDecimal128 and isinstance(value, BsonDecimal128):
+            self.average_rating = value.to_decimal()
 
     def update_stats(self):
         """Update writer statistics"""
+        # djongo mistranslates filtered Count()/Sum() aggregates (the
+        # filter is silently dropped), so the counters stay as separate
+        # equality-filtered COUNTs. The completed projects are read once
+        # as three narrow columns and summed/compared in Python instead
+        # of materializing each one as a full model instance.
         projects = WriterProject.objects.filter(writer=self.writer)
-        
         self.total_projects = projects.count()
-        self.completed_projects = projects.filter(status='completed').count()
         self.pending_projects = projects.filter(status='pending').count()
         self.in_progress_projects = projects.filter(status='in_progress').count()
         self.issues_count = projects.filter(status='issues').count()
         self.hold_count = projects.filter(status='hold').count()
-        
-        # Calculate total words
-        completed = projects.filter(status='completed')
-        self.total_words_written = sum(p.word_count for p in completed)
-        
-        # Calculate on-time delivery
-        self.on_time_delivery = sum(
-            1 for p in completed 
-            if p.completed_at and p.completed_at <= p.deadline
+
+        completed = total_words = on_time = late = 0
+        completed_rows = projects.filter(status='completed').values_list(
+            'word_count', 'completed_at', 'deadline',
         )
-        self.late_delivery = self.completed_projects - self.on_time_delivery
+        for word_count, completed_at, deadline in completed_rows:
+            completed += 1
+            total_words += word_count or 0
+            if completed_at and deadline and completed_at <= deadline:
+                on_time += 1
+            else:
+                late += 1
+
+        self.completed_projects = completed
+        self.total_words_written = total_words
+        self.on_time_delivery = on_time
+        self.late_delivery = late
         self._normalize_average_rating()
         self.save()
@@ -3,19 +3,55 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.utils import timezone
-from django.db.models import Q, Count
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import Q, Prefetch
 from django.http import JsonResponse
-from .models import WriterProject, ProjectIssue, ProjectComment, WriterStatistics
+from .models import (
+    ACTIVE_STATUSES, WriterProject, ProjectIssue, ProjectComment, WriterStatistics,
+)
 from accounts.models import CustomUser
 import logging
 
 logger = logging.getLogger('writer')
 
 
+def _invalidate_writer_dashboard(writer_id):
+    """Drop the cached dashboard counters after a status-changing write."""
+    cache.delete(f'writer_dash:{writer_id}')
+
+
+# Stats counter touched when a project leaves each status.
+_STATUS_COUNTER_FIELDS = {
+    'pending': 'pending_projects',
+    'in_progress': 'in_progress_projects',
+    'completed': 'completed_projects',
+    'issues': 'issues_count',
+    'hold': 'hold_count',
+}
+
+
+def _apply_stats_deltas(writer, deltas):
+    """Adjust the writer's stats counters by the given field deltas.
+
+    Djongo cannot translate F()-arithmetic UPDATEs, so this reads the
+    row, adjusts in Python and writes back just the touched columns.
+    update_stats() remains the reconciliation pass for any drift.
+    """
+    stats = WriterStatistics.objects.filter(writer=writer).first()
+    if stats is None:
+        return
+    for field, delta in deltas.items():
+        setattr(stats, field, max(0, (getattr(stats, field) or 0) + delta))
+    stats.save(update_fields=[*deltas, 'last_updated'])
+
+
 def writer_required(view_func):
     """Decorator to ensure user is a writer"""
     def wrapper(request, *args, **kwargs):
-        if request.user.role != 'writer':
+        # RoleMiddleware resolves the role once per request
+        if getattr(request, 'role', None) != 'writer':
             messages.error(request, 'Access denied. Writer privileges required.')
             return redirect('home_dashboard')
         return view_func(request, *args, **kwargs)
@@ -28,24 +64,45 @@ def writer_dashboard(request):
     """Writer Dashboard View"""
     writer = request.user
     
-    # Get or create writer statistics (djongo-safe)
+    # Get or create writer statistics (djongo-safe). A short-lived cache
+    # marker records the last refresh, so warm hits skip the update_stats
+    # aggregate entirely. (The old timedelta probe also used .seconds,
+    # which wraps daily; the marker TTL avoids that bug outright.)
     stats, created = WriterStatistics.fetch_or_create_single(writer)
-    if created or (timezone.now() - stats.last_updated).seconds > 300:  # Update every 5 mins
+    if created or not cache.get(f'writer_stats_fresh:{writer.pk}'):
         stats.update_stats()
+        cache.set(f'writer_stats_fresh:{writer.pk}', 1, 300)
     
     # Get all projects for the writer
     all_projects = WriterProject.objects.filter(writer=writer)
-    
-    # Count by status
-    total_projects = all_projects.count()
-    pending_tasks = all_projects.filter(status='pending').count()
-    in_progress = all_projects.filter(status='in_progress').count()
-    completed = all_projects.filter(status='completed').count()
-    issues = all_projects.filter(status='issues').count()
-    hold = all_projects.filter(status='hold').count()
-    
+
+    # Per-status COUNTs: djongo parses a filtered Count() annotation as a
+    # plain COUNT(*), silently returning the total for every status, so
+    # the tallies must stay as separate equality-filtered counts. The
+    # 5-minute cache (dropped whenever a project changes status) keeps
+    # them off the warm path anyway.
+    def compute_counts():
+        return {
+            'total': all_projects.count(),
+            'pending': all_projects.filter(status='pending').count(),
+            'in_progress': all_projects.filter(status='in_progress').count(),
+            'completed': all_projects.filter(status='completed').count(),
+            'issues': all_projects.filter(status='issues').count(),
+            'hold': all_projects.filter(status='hold').count(),
+        }
+
+    counts = cache.get_or_set(f'writer_dash:{writer.pk}', compute_counts, 300)
+    total_projects = counts['total']
+    pending_tasks = counts['pending']
+    in_progress = counts['in_progress']
+    completed = counts['completed']
+    issues = counts['issues']
+    hold = counts['hold']
+
     # Recent projects for "My Tasks" table
-    recent_projects = all_projects.exclude(status='completed').order_by('-created_at')[:5]
+    recent_projects = all_projects.filter(status__in=ACTIVE_STATUSES).only(
+        'job_id', 'topic', 'deadline', 'status', 'created_at',
+    ).order_by('-created_at')[:5]
     
     # Calculate project status breakdown for chart
     status_breakdown = {
@@ -106,9 +163,18 @@ def all_projects(request):
             Q(topic__icontains=search_query)
         )
     
-    # Order by created date
-    projects = projects.order_by('-created_at')
-    
+    # Order by created date; fetch only the columns the table renders --
+    # the long text and file fields stay in the database.
+    projects = projects.only(
+        'job_id', 'topic', 'word_count', 'deadline', 'status',
+        'referencing', 'created_at',
+    ).order_by('-created_at')
+
+    # One page at a time: memory stays O(page size) however many
+    # projects the writer has accumulated.
+    paginator = Paginator(projects, 25)
+    projects = paginator.get_page(request.GET.get('page'))
+
     context = {
         'projects': projects,
         'status_filter': status_filter,
@@ -124,11 +190,24 @@ def all_projects(request):
 def project_detail(request, project_id):
     """View project details"""
     writer = request.user
-    project = get_object_or_404(WriterProject, id=project_id, writer=writer)
-    
-    # Get comments and issues
-    comments = project.comments.all().order_by('-created_at')
-    issues = project.issues.all().order_by('-created_at')
+    project = get_object_or_404(
+        WriterProject.objects.select_related('writer', 'allocated_by').prefetch_related(
+            Prefetch(
+                'comments',
+                queryset=ProjectComment.objects.select_related('user').order_by('-created_at'),
+            ),
+            Prefetch(
+                'issues',
+                queryset=ProjectIssue.objects.select_related('reported_by', 'assigned_to').order_by('-created_at'),
+            ),
+        ),
+        id=project_id,
+        writer=writer,
+    )
+
+    # Both hit the prefetched caches -- no extra queries
+    comments = project.comments.all()
+    issues = project.issues.all()
     
     context = {
         'project': project,
@@ -148,8 +227,9 @@ def start_project(request, project_id):
     
     if project.status == 'pending':
         project.mark_in_progress()
+        _invalidate_writer_dashboard(writer.pk)
         messages.success(request, f'Project {project.job_id} marked as In Progress.')
-        logger.info(f"Writer {writer.email} started project {project.job_id}")
+        logger.info("Writer %s started project %s", writer.email, project.job_id)
     else:
         messages.warning(request, 'Project cannot be started from current status.')
     
@@ -171,13 +251,31 @@ def submit_project(request, project_id):
             messages.error(request, 'Please upload the submission file.')
             return redirect('project_detail', project_id=project.id)
         
+        previous_status = project.status
         project.submission_file = submission_file
         project.submission_notes = submission_notes
         project.submitted_at = timezone.now()
-        project.mark_completed()
-        
+        project.mark_completed(extra_update_fields=[
+            'submission_file', 'submission_notes', 'submitted_at',
+        ])
+        _invalidate_writer_dashboard(writer.pk)
+
+        # Bump the counters the event touches, including the one for the
+        # status the project just left.
+        on_time = 1 if project.completed_at <= project.deadline else 0
+        deltas = {
+            'completed_projects': 1,
+            'total_words_written': project.word_count,
+            'on_time_delivery': on_time,
+            'late_delivery': 1 - on_time,
+        }
+        prev_field = _STATUS_COUNTER_FIELDS.get(previous_status)
+        if prev_field and prev_field not in deltas:
+            deltas[prev_field] = -1
+        _apply_stats_deltas(writer, deltas)
+
         messages.success(request, f'Project {project.job_id} submitted successfully!')
-        logger.info(f"Writer {writer.email} submitted project {project.job_id}")
+        logger.info("Writer %s submitted project %s", writer.email, project.job_id)
         return redirect('all_projects')
     
     return redirect('project_detail', project_id=project.id)
@@ -193,7 +291,7 @@ def writer_issues(request):
     projects_with_issues = WriterProject.objects.filter(
         writer=writer,
         status='issues'
-    ).order_by('-updated_at')
+    ).only('job_id', 'topic', 'deadline', 'updated_at').order_by('-updated_at')
     
     # Get all project issues reported by writer
     all_issues = ProjectIssue.objects.filter(
@@ -224,22 +322,30 @@ def report_issue(request, project_id):
             messages.error(request, 'All fields are required.')
             return redirect('project_detail', project_id=project.id)
         
-        # Create issue
-        ProjectIssue.objects.create(
-            project=project,
-            issue_type=issue_type,
-            title=title,
-            description=description,
-            reported_by=writer,
-            status='open'
-        )
-        
-        # Update project status
-        project.status = 'issues'
-        project.save()
-        
+        # One transaction, and the status flip touches only the two
+        # changed columns instead of rewriting the whole document.
+        previous_status = project.status
+        with transaction.atomic():
+            ProjectIssue.objects.create(
+                project=project,
+                issue_type=issue_type,
+                title=title,
+                description=description,
+                reported_by=writer,
+                status='open'
+            )
+            WriterProject.objects.filter(pk=project.pk).update(
+                status='issues', updated_at=timezone.now(),
+            )
+        _invalidate_writer_dashboard(writer.pk)
+        deltas = {'issues_count': 1}
+        prev_field = _STATUS_COUNTER_FIELDS.get(previous_status)
+        if prev_field and prev_field not in deltas:
+            deltas[prev_field] = -1
+        _apply_stats_deltas(writer, deltas)
+
         messages.success(request, 'Issue reported successfully.')
-        logger.info(f"Writer {writer.email} reported issue for project {project.job_id}")
+        logger.info("Writer %s reported issue for project %s", writer.email, project.job_id)
         return redirect('writer_issues')
     
     return redirect('project_detail', project_id=project.id)
@@ -254,7 +360,7 @@ def writer_hold(request):
     hold_projects = WriterProject.objects.filter(
         writer=writer,
         status='hold'
-    ).order_by('-updated_at')
+    ).only('job_id', 'topic', 'word_count', 'deadline', 'updated_at').order_by('-updated_at')
     
     context = {
         'hold_projects': hold_projects,
@@ -277,22 +383,30 @@ def request_hold(request, project_id):
             messages.error(request, 'Please provide a reason for hold.')
             return redirect('project_detail', project_id=project.id)
         
-        # Create issue for hold request
-        ProjectIssue.objects.create(
-            project=project,
-            issue_type='other',
-            title='Hold Request',
-            description=f'Hold Reason: {reason}',
-            reported_by=writer,
-            status='open'
-        )
-        
-        # Update project status
-        project.status = 'hold'
-        project.save()
-        
+        # One transaction, and the status flip touches only the two
+        # changed columns instead of rewriting the whole document.
+        previous_status = project.status
+        with transaction.atomic():
+            ProjectIssue.objects.create(
+                project=project,
+                issue_type='other',
+                title='Hold Request',
+                description=f'Hold Reason: {reason}',
+                reported_by=writer,
+                status='open'
+            )
+            WriterProject.objects.filter(pk=project.pk).update(
+                status='hold', updated_at=timezone.now(),
+            )
+        _invalidate_writer_dashboard(writer.pk)
+        deltas = {'hold_count': 1}
+        prev_field = _STATUS_COUNTER_FIELDS.get(previous_status)
+        if prev_field and prev_field not in deltas:
+            deltas[prev_field] = -1
+        _apply_stats_deltas(writer, deltas)
+
         messages.success(request, 'Project put on hold. Admin will review your request.')
-        logger.info(f"Writer {writer.email} put project {project.job_id} on hold")
+        logger.info("Writer %s put project %s on hold", writer.email, project.job_id)
         return redirect('writer_hold')
     
     return redirect('project_detail', project_id=project.id)
@@ -304,10 +418,20 @@ def writer_close(request):
     """View closed/completed projects"""
     writer = request.user
     
-    closed_projects = WriterProject.objects.filter(
+    # Two equality lookups instead of status__in: each seeks the
+    # (writer, status, ...) compound index, and closed rows -- which have
+    # no completed_at -- get their own ordering rather than forcing a
+    # NULL-heavy sort. Djongo's union() support is unreliable, so the two
+    # short result lists are concatenated in Python.
+    completed_projects = WriterProject.objects.filter(
+        writer=writer,
+        status='completed'
+    ).only('job_id', 'topic', 'word_count', 'status', 'completed_at').order_by('-completed_at')
+    closed_only = WriterProject.objects.filter(
         writer=writer,
-        status__in=['completed', 'closed']
-    ).order_by('-completed_at')
+        status='closed'
+    ).only('job_id', 'topic', 'word_count', 'status', 'completed_at', 'updated_at').order_by('-updated_at')
+    closed_projects = list(completed_projects) + list(closed_only)
     
     context = {
         'closed_projects': closed_projects,